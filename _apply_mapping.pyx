@@ -0,0 +1,60 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled identifier walk used by script.apply_mapping when available.
+
+Build in place (next to script.py) with:
+
+    python setup.py build_ext --inplace
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISALNUM
+
+# Word characters in the ASCII range: [A-Za-z0-9_]
+cdef bint[128] _WORD_ASCII
+cdef int _c
+for _c in range(128):
+    _WORD_ASCII[_c] = (
+        (48 <= _c <= 57) or (65 <= _c <= 90) or (97 <= _c <= 122) or _c == 95
+    )
+
+
+cdef inline bint _is_word_char(Py_UCS4 ch):
+    """Same notion of a word character as the regex '\\b' anchor."""
+    if ch < 128:
+        return _WORD_ASCII[ch]
+    return Py_UNICODE_ISALNUM(ch)
+
+
+def apply_mapping_walk(str text, dict mapping):
+    """
+    Replace every whole word of 'text' whose lowercase spelling is a key of
+    'mapping' (canonical_name -> new_name) by the mapped name.
+    """
+    cdef Py_ssize_t n = len(text)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t start
+    cdef Py_ssize_t last = 0
+    cdef list parts = []
+    cdef object new_name
+
+    while i < n:
+        if not _is_word_char(text[i]):
+            i += 1
+            continue
+
+        # Scan the whole word, then look it up once
+        start = i
+        i += 1
+        while i < n and _is_word_char(text[i]):
+            i += 1
+
+        new_name = mapping.get(text[start:i].lower())
+        if new_name is not None:
+            parts.append(text[last:start])
+            parts.append(new_name)
+            last = i
+
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return "".join(parts)
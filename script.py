@@ -1,14 +1,82 @@
+import os
 import re
+import sys
+import json
+import mmap
+import string
+import hashlib
 import argparse
+import warnings
+import functools
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:  # pragma: no cover - fall back to the regex scan
+    ahocorasick = None
+
+try:
+    # optional compiled walker: python setup.py build_ext --inplace
+    from _apply_mapping import apply_mapping_walk
+except ImportError:  # pragma: no cover - pure Python paths below
+    apply_mapping_walk = None
+
+__version__ = "1.1.0"
 
 IDENT_RE = r"[A-Za-z][A-Za-z0-9_]*"
 
+# Per-file mappings are cached here (relative to the output directory).
+CACHE_DIR_NAME = ".cache"
+
+# Sources at least this large are memory-mapped instead of read().
+MMAP_THRESHOLD = 1 << 20
+
+_COMMENT_FIND = "--"
+# Every line boundary recognised by str.splitlines()
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+# A comment runs to the end of the line, so lines stay aligned after removal.
+_COMMENT_RE = re.compile(f"--[^{_LINE_BREAKS}]*")
+# Non-empty lines, for scanning a file lazily instead of splitting it all.
+_LINE_RE = re.compile(f"[^{_LINE_BREAKS}]+")
+
+# Patterns used on every scanned line, compiled once at import time.
+# The analysis runs on the lowercased source, so no re.IGNORECASE: keywords
+# are matched as plain lowercase literals.
+_TYPE_AFTER_COLON_RE = re.compile(
+    rf":\s*(?:constant\s+)?(?:in\s+out\s+|in\s+|out\s+)?({IDENT_RE})"
+)
+_ARRAY_RE = re.compile(r"\barray\b")
+_ARRAY_OF_RE = re.compile(rf"\bof\s+({IDENT_RE})")
+_RETURN_RE = re.compile(rf"\breturn\s+({IDENT_RE})")
+_TYPE_DECL_RE = re.compile(rf"^\s*(type|subtype)\s+({IDENT_RE})\b")
+_PARAMS_RE = re.compile(r"\((.*)\)", re.DOTALL)
+_PARAM_NAMES_RE = re.compile(r"\s*([A-Za-z0-9_,\s]+):")
+_ASSIGN_RE = re.compile(rf"^\s*({IDENT_RE})\s*:=")
+# Whole-file scans. Starting with the keyword literal (and checking the
+# leading word boundary with a lookbehind after it, e.g. 'for(?<!\wfor)'
+# for '\bfor') lets the regex engine jump between candidate positions with
+# its fast literal search instead of trying the pattern at every offset.
+_PROC_FUNC_RE = re.compile(
+    r"(?:procedure(?<!\wprocedure)|function(?<!\wfunction))\b"
+)
+_FOR_LOOP_RE = re.compile(rf"for(?<!\wfor)\s+({IDENT_RE})\s+in\b")
+_IS_RE = re.compile(r"is(?<!\wis)\b")
+_BEGIN_RE = re.compile(r"begin(?<!\wbegin)\b")
+
+# str.translate tables for the hand-written declaration scanner: deleting
+# the allowed characters leaves an empty string (or only blanks) when the
+# input is valid, and the check runs in C.
+_IDENT_START = frozenset(string.ascii_letters)
+_IDENT_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+_DECL_NAMES_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_,")
+
 
 def strip_comment(line: str) -> str:
     """Remove Ada line comment starting with --."""
-    idx = line.find("--")
+    idx = line.find(_COMMENT_FIND)
     if idx != -1:
         return line[:idx]
     return line
@@ -20,23 +88,34 @@ def is_package_unit(text: str) -> bool:
     - Ignore leading with/use lines and comments.
     - If the first significant keyword is 'package' -> treat as package unit.
     - If we see 'procedure'/'function' first -> treat as subprogram file.
+
+    'text' is the lowercased source.
     """
-    for line in text.splitlines():
-        code = strip_comment(line).strip().lower()
+    # Only the first few lines matter: iterate lazily and stop at the first
+    # significant one.
+    for mline in _LINE_RE.finditer(text):
+        code = strip_comment(mline.group()).strip()
         if not code:
             continue
-        if code.startswith("with ") or code.startswith("use "):
+        if code.startswith(("with ", "use ")):
             continue
         if code.startswith("package "):
             return True
-        if code.startswith("procedure ") or code.startswith("function "):
+        if code.startswith(("procedure ", "function ")):
             return False
     return False
 
 
-def collect_type_names(line: str) -> Dict[str, str]:
+# Declaration lines repeat a lot across a code base (e.g. "X : Integer;"),
+# so the per-line parsers below are memoized on the comment-free line.
+_LINE_CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=_LINE_CACHE_SIZE)
+def collect_type_names(code: str) -> Tuple[Tuple[str, str], ...]:
     """
-    Find type names used in a declaration line and return mapping to UPPERCASE.
+    Find type names used in a (lowercased, comment-free) declaration line and return
+    (name, UPPERCASE name) pairs, ready for dict() / dict.update().
 
     Examples:
       X : Integer := 0;           -> Integer
@@ -45,143 +124,186 @@ def collect_type_names(line: str) -> Dict[str, str]:
       function F (...) return Float;      -> Float
     """
     mapping: Dict[str, str] = {}
-    code = strip_comment(line)
 
     # Type name after colon (parameters/variables), possibly with 'constant', 'in', 'out'
-    mtype = re.search(
-        rf":\s*(?:constant\s+)?(?:in\s+out\s+|in\s+|out\s+)?({IDENT_RE})",
-        code,
-        re.IGNORECASE,
-    )
+    mtype = _TYPE_AFTER_COLON_RE.search(code)
     if mtype:
         tname = mtype.group(1)
-        mapping[tname.lower()] = tname.upper()
+        mapping[tname] = tname.upper()
 
     # Element type of an array: "array (...) of <TYPE>"
-    if re.search(r"\barray\b", code, re.IGNORECASE):
-        marray = re.search(rf"\bof\s+({IDENT_RE})", code, re.IGNORECASE)
+    if _ARRAY_RE.search(code):
+        marray = _ARRAY_OF_RE.search(code)
         if marray:
             tname = marray.group(1)
-            mapping[tname.lower()] = tname.upper()
+            mapping[tname] = tname.upper()
 
     # Return type in function declarations: "return <TYPE>"
-    mret = re.search(rf"\breturn\s+({IDENT_RE})", code, re.IGNORECASE)
+    mret = _RETURN_RE.search(code)
     if mret:
         tname = mret.group(1)
-        mapping[tname.lower()] = tname.upper()
+        mapping[tname] = tname.upper()
 
-    return mapping
+    return tuple(mapping.items())
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same notion of a word character as the regex '\\b' anchor."""
+    return ch.isalnum() or ch == "_"
+
+
+def _is_identifier(name: str) -> bool:
+    """True if 'name' matches IDENT_RE exactly."""
+    return (
+        bool(name)
+        and name[0] in _IDENT_START
+        and not name[1:].translate(_IDENT_TABLE)
+    )
+
+
+def _has_constant_keyword(rest: str) -> bool:
+    """True if the whole word 'constant' occurs in (lowercased) 'rest'."""
+    n = len(rest)
+    pos = rest.find("constant")
+    while pos != -1:
+        end = pos + 8
+        if (pos == 0 or not _is_word_char(rest[pos - 1])) and (
+            end == n or not _is_word_char(rest[end])
+        ):
+            return True
+        pos = rest.find("constant", pos + 1)
+    return False
+
+
+@functools.lru_cache(maxsize=_LINE_CACHE_SIZE)
+def _parse_object_declaration(code: str) -> Optional[Tuple[Tuple[str, ...], bool]]:
+    """
+    Parse an object declaration line:
+        A, B : constant Integer := 10;
+        C    : Integer := 0;
+
+    i.e. identifiers, commas and blanks up to the first ':'. Checked with
+    str.translate rather than with regexes.
+
+    Returns (declared_names, is_constant), or None if the line is not one.
+    """
+    colon = code.find(":")
+    if colon <= 0:
+        return None
+    id_part = code[:colon]
+    leftover = id_part.translate(_DECL_NAMES_TABLE)
+    if leftover and not leftover.isspace():
+        return None
+
+    names: List[str] = []
+    for ident in id_part.split(","):
+        name = ident.strip()
+        if not name:
+            continue
+        if not _is_identifier(name):
+            continue
+        names.append(name)
+    return tuple(names), _has_constant_keyword(code[colon + 1:])
 
 
 def collect_declarations(
-    lines: List[str], make_var_upper: bool
-) -> Tuple[Dict[str, str], Dict[str, str]]:
+    lines: List[str], make_var_upper: bool, out: Dict[str, str]
+) -> None:
     """
-    Scan a list of lines for declarations and return:
-        (identifier_mapping, type_name_mapping)
+    Scan a list of lowercased, comment-free lines for declarations and add
+    the declared identifiers, then the type names they use, to 'out'.
+    Type names are added last so they win over a same-named identifier.
 
     - make_var_upper=True  => variables/constants/types -> UPPERCASE
     - make_var_upper=False => variables (non-constant) -> lowercase,
                               constants/types -> UPPERCASE
     """
-    identifiers: Dict[str, str] = {}
     type_names: Dict[str, str] = {}
 
     for raw in lines:
-        code = strip_comment(raw).rstrip()
+        code = raw.rstrip()
         stripped = code.strip()
         if not stripped:
             continue
 
         # TYPE / SUBTYPE declarations: declared name always uppercase
-        m = re.match(rf"^\s*(type|subtype)\s+({IDENT_RE})\b", code, re.IGNORECASE)
+        m = _TYPE_DECL_RE.match(code)
         if m:
             name = m.group(2)
-            identifiers[name.lower()] = name.upper()
+            out[name] = name.upper()
             # Also capture any type names used on the RHS
-            type_map = collect_type_names(code)
-            type_names.update(type_map)
+            type_names.update(collect_type_names(code))
             continue
 
-        # Object declarations:
-        #   A, B : constant Integer := 10;
-        #   C    : Integer := 0;
-        m = re.match(r"^\s*([A-Za-z0-9_,\s]+):(.*)$", code)
-        if m:
-            id_part = m.group(1)
-            rest = m.group(2)
-            is_const = bool(re.search(r"\bconstant\b", rest, re.IGNORECASE))
-
-            for ident in id_part.split(","):
-                name = ident.strip()
-                if not name:
-                    continue
-                if not re.match(rf"^{IDENT_RE}$", name):
-                    continue
-
+        # Object declarations
+        decl = _parse_object_declaration(code)
+        if decl is not None:
+            names, is_const = decl
+            for name in names:
                 if is_const:
                     new_name = name.upper()
                 else:
                     if make_var_upper:
                         new_name = name.upper()
                     else:
-                        new_name = name.lower()
+                        new_name = name
 
-                identifiers[name.lower()] = new_name
+                out[name] = new_name
 
             # And capture any type names used here
-            type_map = collect_type_names(code)
-            type_names.update(type_map)
+            type_names.update(collect_type_names(code))
 
-    return identifiers, type_names
+    out.update(type_names)
 
 
-def collect_package_mapping(text: str) -> Dict[str, str]:
+def collect_package_mapping(stripped_lines: List[str]) -> Dict[str, str]:
     """
-    For package spec/body files:
+    For package spec/body files (given as lowercased, comment-free lines):
     - Treat *all* variables/constants/types as 'global' => UPPERCASE.
     - All type names used in declarations (built-in or user-defined) -> UPPERCASE.
     """
-    lines = text.splitlines()
-    id_map, type_map = collect_declarations(lines, make_var_upper=True)
     mapping: Dict[str, str] = {}
-    mapping.update(id_map)
-    mapping.update(type_map)
+    collect_declarations(stripped_lines, make_var_upper=True, out=mapping)
     return mapping
 
 
-def find_first_subprogram(text: str):
+def find_first_subprogram(stripped_text: str):
     """
-    Find the first procedure/function in the text, skipping commented parts.
+    Find the first procedure/function in the lowercased, comment-free text.
 
     Returns (kind, index) where kind is 'procedure' or 'function',
     or (None, None) if not found.
     """
-    offset = 0
-    for line in text.splitlines(True):  # keep line endings
-        code = strip_comment(line)
-        m = re.search(r"\b(procedure|function)\b", code, re.IGNORECASE)
-        if m:
-            return m.group(1).lower(), offset + m.start()
-        offset += len(line)
+    m = _PROC_FUNC_RE.search(stripped_text)
+    if m:
+        return m.group(), m.start()
     return None, None
 
 
-def find_keyword_after(text: str, keyword: str, start: int):
-    """Find the position of a keyword after 'start', or None."""
+def find_keyword_after(text: str, keyword_re: "re.Pattern[str]", start: int):
+    """
+    Find the position of a keyword (precompiled pattern such as _IS_RE)
+    after 'start', or None.
+    """
     if start is None:
         return None
-    m = re.search(rf"\b{keyword}\b", text[start:], re.IGNORECASE)
+    # pos= avoids copying text[start:]; 'start' is always on a word boundary
+    m = keyword_re.search(text, start)
     if not m:
         return None
-    return start + m.start()
+    return m.start()
 
 
-def collect_subprogram_mapping(text: str) -> Dict[str, str]:
+def collect_subprogram_mapping(
+    stripped_lines: List[str], stripped_text: str
+) -> Dict[str, str]:
     """
     Collect mapping of identifiers and type names for a standalone
     procedure/function file.
 
+    The file is given lowercased with comments already removed, both as
+    lines and as the same lines joined with newlines.
+
     Rules:
     - Declarations before the first subprogram: globals -> UPPERCASE.
     - Parameters and local variables: lowercase (non-constants).
@@ -190,92 +312,110 @@ def collect_subprogram_mapping(text: str) -> Dict[str, str]:
     - Loop index in 'for I in ...' : lowercase.
     - Undeclared identifiers on LHS of ':=' are treated as external globals -> UPPERCASE.
     """
-    kind, proc_start = find_first_subprogram(text)
+    kind, proc_start = find_first_subprogram(stripped_text)
     if kind is None:
         # No procedure/function found; treat as package unit
-        return collect_package_mapping(text)
+        return collect_package_mapping(stripped_lines)
 
     # Declarations before the subprogram: globals
-    before_lines = text[:proc_start].splitlines()
-    global_id_map, global_type_map = collect_declarations(before_lines, make_var_upper=True)
+    before_lines = stripped_text[:proc_start].splitlines()
+    mapping: Dict[str, str] = {}
+    collect_declarations(before_lines, make_var_upper=True, out=mapping)
 
-    is_pos = find_keyword_after(text, "is", proc_start)
-    begin_pos = find_keyword_after(text, "begin", is_pos if is_pos is not None else proc_start)
+    is_pos = find_keyword_after(stripped_text, _IS_RE, proc_start)
+    begin_pos = find_keyword_after(stripped_text, _BEGIN_RE, is_pos if is_pos is not None else proc_start)
 
     # If we can't find declarative part, just use globals
     if is_pos is None or begin_pos is None:
-        mapping: Dict[str, str] = {}
-        mapping.update(global_id_map)
-        mapping.update(global_type_map)
         return mapping
 
-    header = text[proc_start:is_pos]
-    declarative_lines = text[is_pos:begin_pos].splitlines()
-
-    mapping: Dict[str, str] = {}
-    mapping.update(global_id_map)
-    mapping.update(global_type_map)
+    header = stripped_text[proc_start:is_pos]
+    declarative_lines = stripped_text[is_pos:begin_pos].splitlines()
 
     # Parameters: names -> lowercase, types -> UPPERCASE
-    paren_match = re.search(r"\((.*)\)", header, re.DOTALL)
+    paren_match = _PARAMS_RE.search(header)
     if paren_match:
         params_str = paren_match.group(1)
         for group in params_str.split(";"):
-            group_code = strip_comment(group)
             # names before colon
-            m = re.match(rf"\s*([A-Za-z0-9_,\s]+):", group_code)
+            m = _PARAM_NAMES_RE.match(group)
             if m:
                 id_part = m.group(1)
                 for ident in id_part.split(","):
                     name = ident.strip()
                     if not name:
                         continue
-                    if not re.match(rf"^{IDENT_RE}$", name):
+                    if not _is_identifier(name):
                         continue
-                    mapping[name.lower()] = name.lower()
+                    mapping[name] = name
             # type names in parameter spec
-            type_map = collect_type_names(group_code)
-            mapping.update(type_map)
+            mapping.update(collect_type_names(group))
 
     # Return type for functions
-    m_return = re.search(rf"\breturn\s+({IDENT_RE})", header, re.IGNORECASE)
+    m_return = _RETURN_RE.search(header)
     if m_return:
         ret_type = m_return.group(1)
-        mapping[ret_type.lower()] = ret_type.upper()
+        mapping[ret_type] = ret_type.upper()
 
     # Declarations between 'is' and 'begin'
-    local_id_map, local_type_map = collect_declarations(
-        declarative_lines, make_var_upper=False
-    )
-    mapping.update(local_id_map)
-    mapping.update(local_type_map)
+    collect_declarations(declarative_lines, make_var_upper=False, out=mapping)
 
     # Loop variables: 'for I in SOMETHING loop' => I is local -> lowercase
-    no_comment_text = "\n".join(strip_comment(l) for l in text.splitlines())
-    for mloop in re.finditer(rf"\bfor\s+({IDENT_RE})\s+in\b", no_comment_text, re.IGNORECASE):
+    for mloop in _FOR_LOOP_RE.finditer(stripped_text):
         loop_var = mloop.group(1)
-        canon = loop_var.lower()
         # If it's not already a constant/type/global, treat as local var
-        if canon not in mapping or mapping[canon].isupper():
-            mapping[canon] = loop_var.lower()
+        if loop_var not in mapping or mapping[loop_var].isupper():
+            mapping[loop_var] = loop_var
 
     # External globals: identifiers on the left side of ':=' that are not
     # declared locally (no param/local/constant/type) are assumed to be
     # global variables and should be UPPERCASE.
-    assignment_re = re.compile(rf"^\s*({IDENT_RE})\s*:=", re.IGNORECASE)
-    for raw in text.splitlines():
-        code = strip_comment(raw)
-        m = assignment_re.match(code)
+    for code in stripped_lines:
+        m = _ASSIGN_RE.match(code)
         if not m:
             continue
         name = m.group(1)
-        canon = name.lower()
-        if canon not in mapping:
-            mapping[canon] = name.upper()
+        if name not in mapping:
+            mapping[name] = name.upper()
 
     return mapping
 
 
+def _apply_mapping_automaton(text: str, mapping: Dict[str, str]) -> Optional[str]:
+    """
+    Aho-Corasick variant of apply_mapping: one pass over the text whatever
+    the number of identifiers. Returns None if it cannot be used.
+    """
+    lower_text = text.lower()
+    if len(lower_text) != len(text):
+        # Some characters change length when lowercased; offsets would not
+        # line up with the original text.
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for canon_name, new_name in mapping.items():
+        automaton.add_word(canon_name, (len(canon_name), new_name))
+    automaton.make_automaton()
+
+    parts: List[str] = []
+    pos = 0
+    n = len(text)
+    for end, (length, new_name) in automaton.iter(lower_text):
+        start = end - length + 1
+        if start < pos:
+            continue
+        # Whole identifiers only (equivalent of \b...\b)
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < n and _is_word_char(text[end + 1]):
+            continue
+        parts.append(text[pos:start])
+        parts.append(new_name)
+        pos = end + 1
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
 def apply_mapping(text: str, mapping: Dict[str, str]) -> str:
     """
     Apply identifier case mapping to the whole Ada source text.
@@ -285,27 +425,102 @@ def apply_mapping(text: str, mapping: Dict[str, str]) -> str:
     if not mapping:
         return text
 
-    result = text
-    # sort by length descending so longer identifiers match first
-    for canon_name, new_name in sorted(mapping.items(), key=lambda kv: -len(kv[0])):
-        pattern = re.compile(rf"\b{re.escape(canon_name)}\b", re.IGNORECASE)
-        result = pattern.sub(new_name, result)
+    if apply_mapping_walk is not None:
+        return apply_mapping_walk(text, mapping)
 
-    return result
+    if ahocorasick is not None:
+        result = _apply_mapping_automaton(text, mapping)
+        if result is not None:
+            return result
 
+    # One alternation of all identifiers, longer ones first, so the text is
+    # scanned a single time instead of once per identifier.
+    alt = "|".join(re.escape(k) for k in sorted(mapping, key=len, reverse=True))
+    # Identifiers are ASCII: the scoped (?a:...) flag restricts case folding
+    # to ASCII, which spares sre the Unicode case tables, while the \b
+    # anchors outside it keep Unicode word boundaries like the other paths.
+    pattern = re.compile(rf"\b(?a:{alt})\b", re.IGNORECASE)
+    return pattern.sub(lambda m: mapping[m.group(0).lower()], text)
 
-def process_file(path: Path, out_dir: Path):
-    """Read, normalize and write a single .ada file."""
-    original = path.read_text(encoding="utf-8")
 
-    if is_package_unit(original):
-        mapping = collect_package_mapping(original)
-    else:
-        mapping = collect_subprogram_mapping(original)
+def cache_key(text: str) -> str:
+    """
+    Key for the mapping cache: hash of the source text and of __version__,
+    so a new release of this script invalidates old entries.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(__version__.encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cached_mapping(cache_dir: Path, key: str) -> Optional[Dict[str, str]]:
+    """Return the cached mapping for 'key', or None on a miss/unreadable entry."""
+    try:
+        data = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+        mapping = data["mapping"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(mapping, dict):
+        return None
+    return mapping
+
+
+def store_cached_mapping(cache_dir: Path, key: str, mapping: Dict[str, str]):
+    """Write 'mapping' to the cache; failures are ignored (cache is optional)."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{key}.json").write_text(
+            json.dumps({"mapping": mapping}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
+def read_source(path: Path) -> str:
+    """
+    Read a UTF-8 source file, with the same newline translation as
+    Path.read_text(). Large files are decoded straight from a memory map,
+    without first copying them into a bytes object.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            text = f.read().decode("utf-8")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    text = str(view, "utf-8")
+    # Universal newlines, as text mode would do
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def process_file(path: Path, out_dir: Path):
+    """Read, normalize and write a single .ada file into (existing) out_dir."""
+    original = read_source(path)
+
+    # Unchanged sources reuse the mapping computed on a previous run
+    cache_dir = out_dir / CACHE_DIR_NAME
+    key = cache_key(original)
+    mapping = load_cached_mapping(cache_dir, key)
+    if mapping is None:
+        # The analysis only needs each name's lower/UPPER form, so it runs on
+        # the lowercased text; comments are stripped once and shared by all
+        # collectors.
+        lower_text = original.lower()
+        stripped_lines = _COMMENT_RE.sub("", lower_text).splitlines()
+        if is_package_unit(lower_text):
+            mapping = collect_package_mapping(stripped_lines)
+        else:
+            stripped_text = "\n".join(stripped_lines)
+            mapping = collect_subprogram_mapping(stripped_lines, stripped_text)
+        store_cached_mapping(cache_dir, key, mapping)
 
     new_text = apply_mapping(original, mapping)
 
-    out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / path.name
     out_path.write_text(new_text, encoding="utf-8")
     print(f"Processed {path} -> {out_path}")
@@ -324,6 +539,13 @@ def main():
         help="Output directory for corrected files (default: <source_dir>/_normalized)",
         default=None,
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files processed in parallel (default: number of CPUs)",
+    )
     args = parser.parse_args()
 
     src = Path(args.source_dir)
@@ -332,9 +554,63 @@ def main():
 
     out_dir = Path(args.out_dir) if args.out_dir else src / "_normalized"
 
-    for entry in src.iterdir():
-        if entry.is_file() and entry.suffix.lower() == ".ada":
+    # scandir entries answer is_file() from the directory listing, without
+    # an extra stat() per file (symlinks are still followed, as before).
+    with os.scandir(src) as it:
+        files = [
+            Path(entry.path)
+            for entry in it
+            if entry.name.lower().endswith(".ada") and entry.is_file()
+        ]
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.jobs <= 1 or len(files) <= 1:
+        for entry in files:
             process_file(entry, out_dir)
+        return
+
+    # Files are independent: spread them over worker processes. On Linux,
+    # fork lets workers inherit the compiled patterns instead of
+    # re-importing; elsewhere (e.g. macOS, where fork is unsafe) keep the
+    # platform default.
+    mp_context = mp.get_context("fork") if sys.platform.startswith("linux") else None
+    jobs = min(args.jobs, len(files))
+    # A few chunks per worker keeps every worker busy without per-file overhead
+    chunksize = max(1, len(files) // (jobs * 4))
+    worker = functools.partial(process_file, out_dir=out_dir)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        # Consume the results so that worker exceptions are raised here
+        for _ in executor.map(worker, files, chunksize=chunksize):
+            pass
+
+
+def source_hash(source: bytes) -> str:
+    """Fingerprint of script.py's source, recorded in _script_c by setup.py."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+# Prefer the ahead-of-time compiled build of this module when it has been
+# built (python setup.py build_ext --inplace) from this very source; this
+# file is the fallback. A stale build is ignored so edits take effect.
+if __name__ != "_script_c":
+    try:
+        import _script_c
+    except ImportError:
+        _script_c = None
+    if _script_c is not None:
+        try:
+            _current_hash = source_hash(Path(__file__).read_bytes())
+        except OSError:
+            _current_hash = None
+        if getattr(_script_c, "SOURCE_HASH", None) == _current_hash:
+            from _script_c import *  # noqa: F401,F403
+        else:
+            warnings.warn(
+                "_script_c was built from a different script.py; using the "
+                "pure Python code. Rebuild with: python setup.py build_ext --inplace",
+                RuntimeWarning,
+            )
 
 
 if __name__ == "__main__":
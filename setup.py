@@ -0,0 +1,41 @@
+"""
+Optional compiled speedups for script.py (requires Cython and a C compiler):
+
+    python setup.py build_ext --inplace
+
+- _apply_mapping: Cython identifier walker used by apply_mapping()
+- _script_c:      script.py compiled ahead of time; script.py imports it
+                  when it was built from the current source and otherwise
+                  runs as plain Python
+
+Rebuild after every change to script.py.
+"""
+
+import hashlib
+from pathlib import Path
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+HERE = Path(__file__).resolve().parent
+BUILD_DIR = HERE / "build"
+
+# _script_c is compiled from a copy of script.py that records the hash of
+# the source it was built from (same computation as script.source_hash).
+source = (HERE / "script.py").read_bytes()
+digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+BUILD_DIR.mkdir(exist_ok=True)
+(BUILD_DIR / "_script_c.py").write_bytes(
+    source + f'\n\nSOURCE_HASH = "{digest}"\n'.encode("utf-8")
+)
+
+setup(
+    name="ada-identifier-normalizer",
+    ext_modules=cythonize(
+        [
+            Extension("_apply_mapping", ["_apply_mapping.pyx"]),
+            Extension("_script_c", ["build/_script_c.py"]),
+        ],
+        language_level=3,
+    ),
+)